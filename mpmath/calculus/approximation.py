@@ -1,4 +1,5 @@
 import warnings
+from itertools import islice
 
 from .calculus import defun
 
@@ -15,30 +16,64 @@
 # and that we automatically transform [a,b] -> [-1,1] and back
 # for convenience.
 
-# Coefficient in Chebyshev approximation
-def chebcoeff(ctx,f,a,b,j,N):
-    s = ctx.mpf(0)
+# Coefficients in Chebyshev approximation
+def chebcoeffs(ctx,f,a,b,N):
     h = ctx.mpf(0.5)
-    for k in range(1, N+1):
-        t = ctx.cospi((k-h)/N)
-        s += f(t*(b-a)*h + (b+a)*h) * ctx.cospi(j*(k-h)/N)
-    return 2*s/N
+    # All cosines needed are cos(pi*i/(2N)) for some integer i, so
+    # one table of 4N values serves both the nodes and the weights,
+    # and f is only evaluated once per node
+    M = 4*N
+    cos_table = [ctx.cospi(ctx.mpf(i)/(2*N)) for i in range(M)]
+    fs = [f(cos_table[2*k-1]*(b-a)*h + (b+a)*h) for k in range(1, N+1)]
+    # The nodes are symmetric about 0, and the weight of the mirrored
+    # node is (-1)**j times the original one, so the sums only run over
+    # half of the nodes (plus the middle one, cos(j*pi/2), for odd N)
+    half = N // 2
+    sums = [fs[k] + fs[N-1-k] for k in range(half)]
+    diffs = [fs[k] - fs[N-1-k] for k in range(half)]
+    c = []
+    for j in range(N):
+        weights = [cos_table[j*(2*k+1) % M] for k in range(half)]
+        if j & 1:
+            s = ctx.fdot(diffs, weights)
+        else:
+            s = ctx.fdot(sums, weights)
+            if N & 1:
+                s += fs[half] * cos_table[j*N % M]
+        c.append(2*s/N)
+    return c
+
+# Evaluate the Chebyshev series c[0]/2 + c[1]*T_1(u) + ... at u in [-1, 1]
+# using Clenshaw's recurrence
+def chebclenshaw(ctx, c, u):
+    try:
+        return ctx._chebclenshaw_fast(c, u)
+    except NotImplementedError:
+        pass
+    b1 = b2 = ctx.zero
+    u2 = 2*u
+    for ck in c[:0:-1]:
+        b1, b2 = u2*b1 - b2 + ck, b1
+    return u*b1 - b2 + c[0]/2
 
 # Generate Chebyshev polynomials T_n(ax+b) in expanded form
 def chebT(ctx, a=1, b=0):
     Tb = [1]
     yield Tb
     Ta = [b, a]
+    a2 = 2*a
+    b2 = 2*b
     while 1:
         yield Ta
         # Recurrence: T[n+1](ax+b) = 2*(ax+b)*T[n](ax+b) - T[n-1](ax+b)
-        Tmp = [0] + [2*a*t for t in Ta]
-        for i, c in enumerate(Ta): Tmp[i] += 2*b*c
+        Tmp = [0] + [a2*t for t in Ta]
+        if b2:
+            for i, c in enumerate(Ta): Tmp[i] += b2*c
         for i, c in enumerate(Tb): Tmp[i] -= c
         Ta, Tb = Tmp, Ta
 
 @defun
-def chebyfit(ctx, f, interval, N, error=False, asc=None):
+def chebyfit(ctx, f, interval, N, error=False, asc=None, basis='monomial'):
     r"""
     Computes a polynomial of degree `N-1` that approximates the
     given function `f` on the interval `[a, b]`. With ``error=True``,
@@ -60,6 +95,12 @@ def chebyfit(ctx, f, interval, N, error=False, asc=None):
     If *asc=False*, descending order of coefficients is used (the term
     of largest degree - first).
 
+    With *basis='chebyshev'*, the coefficients `c_k` of the approximation
+    `c_0 + c_1 T_1(u) + \ldots + c_{N-1} T_{N-1}(u)` in terms of the
+    Chebyshev polynomials of `u = (2x-a-b)/(b-a)` are returned instead,
+    in ascending order (*asc* is ignored). This is the same convention
+    as used by e.g. NumPy's ``Chebyshev(c, domain=[a, b])``.
+
     **Examples**
 
     Here we use :func:`~mpmath.chebyfit` to generate a low-degree approximation
@@ -87,6 +128,16 @@ def chebyfit(ctx, f, interval, N, error=False, asc=None):
         >>> nprint(max([error(1+n/1000.) for n in range(1000)]), 12)
         1.61349954245e-5
 
+    The same approximation in the Chebyshev basis::
+
+        >>> from mpmath import chebyt, fsum
+        >>> c = chebyfit(cos, [1, 2], 5, basis='chebyshev')
+        >>> nprint(c)
+        [0.0663847, -0.483323, -0.00432969, 0.00511459, 2.27876e-5]
+        >>> u = 2*1.6 - 3
+        >>> nprint(fsum(ck*chebyt(k, u) for k, ck in enumerate(c)), 12)
+        -0.0291858904138
+
     **Choice of degree**
 
     The degree `N` can be set arbitrarily high, to obtain an
@@ -94,8 +145,8 @@ def chebyfit(ctx, f, interval, N, error=False, asc=None):
     `N`-term Chebyshev approximation is good to `N/(b-a)` decimal
     places on a unit interval (although this depends on how
     well-behaved `f` is). The cost grows accordingly: ``chebyfit``
-    evaluates the function `(N^2)/2` times to compute the
-    coefficients and an additional `N` times to estimate the error.
+    evaluates the function `N` times to compute the coefficients
+    and an additional `N` times to estimate the error.
 
     **Possible issues**
 
@@ -105,9 +156,8 @@ def chebyfit(ctx, f, interval, N, error=False, asc=None):
     ill-conditioned. It is for example difficult to reach
     15-digit accuracy when evaluating the polynomial using
     machine precision floats, no matter the theoretical
-    accuracy of the polynomial. (The option to return the
-    coefficients in Chebyshev form should be made available
-    in the future.)
+    accuracy of the polynomial. The coefficients in Chebyshev
+    form (*basis='chebyshev'*) do not have this problem.
 
     It is important to note the Chebyshev approximation works
     poorly if `f` is not smooth. A function containing singularities,
@@ -116,25 +166,52 @@ def chebyfit(ctx, f, interval, N, error=False, asc=None):
     nonsmooth features, or by dividing the interval into several
     segments.
     """
+    if basis not in ('monomial', 'chebyshev'):
+        raise ValueError("basis must be 'monomial' or 'chebyshev'")
     a, b = ctx._as_points(interval)
     orig = ctx.prec
     try:
-        ctx.prec = orig + int(N**0.5) + 20
-        c = [chebcoeff(ctx,f,a,b,k,N) for k in range(N)]
-        d = [ctx.zero] * N
-        d[0] = -c[0]/2
+        # Only the expansion into the monomial basis needs many guard
+        # bits; see the error estimate below
+        if basis == 'chebyshev':
+            ctx.prec = orig + 2*N.bit_length() + 5
+        else:
+            ctx.prec = orig + int(N**0.5) + 20
+        c = chebcoeffs(ctx,f,a,b,N)
         h = ctx.mpf(0.5)
-        T = chebT(ctx, ctx.mpf(2)/(b-a), ctx.mpf(-1)*(b+a)/(b-a))
-        for (k, Tk) in zip(range(N), T):
-            for i in range(len(Tk)):
-                d[i] += c[k]*Tk[i]
-        # Estimate maximum error
+        ck = [c[0]/2] + c[1:]
+        if basis == 'monomial':
+            T = chebT(ctx, ctx.mpf(2)/(b-a), ctx.mpf(-1)*(b+a)/(b-a))
+            T = list(islice(T, N))
+            # Coefficient i of the expanded polynomial collects
+            # c[k]*T[k][i] for k >= i; accumulate each with a single
+            # rounding
+            d = [ctx.fdot(ck[i:], [Tk[i] for Tk in T[i:]])
+                 for i in range(N)]
+        # Estimate maximum error of the coefficients actually returned.
+        # In the Chebyshev basis, Clenshaw's recurrence is backward
+        # stable, so this only needs O(log(N)) guard bits; evaluating
+        # the monomial expansion keeps the full working precision. The
+        # extrema cos(pi*k/N) are symmetric about 0, so only half of
+        # them need a cospi() call
+        us = [ctx.cospi(ctx.mpf(k)/N) for k in range(N//2+1)]
+        us += [-u for u in us[(N+1)//2-1:0:-1]]
+        scale = (b-a)*h
+        shift = (b+a)*h
         err = ctx.zero
-        for k in range(N):
-            x = ctx.cos(ctx.pi*k/N) * (b-a)*h + (b+a)*h
-            err = max(err, abs(f(x) - ctx.polyval(d, x, asc=True)))
+        for u in us:
+            x = u*scale + shift
+            if basis == 'chebyshev':
+                y = chebclenshaw(ctx, c, u)
+            else:
+                y = ctx.polyval(d, x, asc=True)
+            err = max(err, abs(f(x) - y))
     finally:
         ctx.prec = orig
+    if basis == 'chebyshev':
+        if error:
+            return ck, +err
+        return ck
     if asc is None:
         warnings.warn("Descending (wrt powers) order of polynomial "
                       "coefficients is deprecated, please adapt you "
@@ -147,7 +224,7 @@ def chebyfit(ctx, f, interval, N, error=False, asc=None):
         return d if asc else d[::-1]
 
 @defun
-def fourier(ctx, f, interval, N):
+def fourier(ctx, f, interval, N, symmetry=None):
     r"""
     Computes the Fourier series of degree `N` of the given function
     on the interval `[a, b]`. More precisely, :func:`~mpmath.fourier` returns
@@ -216,7 +293,19 @@ def fourier(ctx, f, interval, N):
         >>> nprint(fourier(abs, [-1, 0, 1], 0), 10)
         ([0.5], [0.0])
 
+    If the periodic extension of `f` from `[a, b]` is known to be even
+    or odd, passing ``symmetry='even'`` or ``symmetry='odd'`` skips the
+    computation of the sine or cosine series, which are then zero::
+
+        >>> c, s = fourier(lambda x: x, [-pi, pi], 5, symmetry='odd')
+        >>> nprint(c)
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        >>> nprint(s)
+        [0.0, 2.0, -1.0, 0.666667, -0.5, 0.4]
+
     """
+    if symmetry not in (None, 'even', 'odd'):
+        raise ValueError("symmetry must be None, 'even' or 'odd'")
     interval = ctx._as_points(interval)
     a = interval[0]
     b = interval[-1]
@@ -224,12 +313,37 @@ def fourier(ctx, f, interval, N):
     cos_series = []
     sin_series = []
     cutoff = ctx.eps*10
+    m = 2*ctx.pi/L
+    # All the quadratures draw their nodes from the same Gauss-Legendre
+    # rule on the same interval, so f only needs to be sampled once
+    # per node. The harmonics exp(j*n*m*t) at each node are likewise
+    # tabulated by repeated multiplication with exp(j*m*t), instead of
+    # computing a cosine or sine for every n
+    samples = {}
+    def g(t, n):
+        if t not in samples:
+            samples[t] = f(t), [ctx.one, ctx.expj(m*t)]
+        y, harmonics = samples[t]
+        while len(harmonics) <= n:
+            harmonics.append(harmonics[-1]*harmonics[1])
+        return y, harmonics[n]
+    def cos_term(t):
+        y, z = g(t, n)
+        return y*z.real
+    def sin_term(t):
+        y, z = g(t, n)
+        return y*z.imag
     for n in range(N+1):
-        m = 2*n*ctx.pi/L
-        an = 2*ctx.quadgl(lambda t: f(t)*ctx.cos(m*t), interval)/L
-        bn = 2*ctx.quadgl(lambda t: f(t)*ctx.sin(m*t), interval)/L
-        if n == 0:
-            an /= 2
+        if symmetry == 'odd':
+            an = ctx.zero
+        else:
+            an = 2*ctx.quadgl(cos_term, interval)/L
+            if n == 0:
+                an /= 2
+        if symmetry == 'even':
+            bn = ctx.zero
+        else:
+            bn = 2*ctx.quadgl(sin_term, interval)/L
         if abs(an) < cutoff: an = ctx.zero
         if abs(bn) < cutoff: bn = ctx.zero
         cos_series.append(an)
@@ -248,10 +362,38 @@ def fourierval(ctx, series, interval, x):
     """
     cs, ss = series
     ab = ctx._as_points(interval)
-    a = interval[0]
-    b = interval[-1]
-    m = 2*ctx.pi/(ab[-1]-ab[0])
-    s = ctx.zero
-    s += ctx.fsum(cs[n]*ctx.cos(m*n*x) for n in range(len(cs)) if cs[n])
-    s += ctx.fsum(ss[n]*ctx.sin(m*n*x) for n in range(len(ss)) if ss[n])
-    return s
+    a = ab[0]
+    b = ab[-1]
+    try:
+        return ctx._fourierval_fast(cs, ss, b-a, x)
+    except NotImplementedError:
+        pass
+    n = max(len(cs), len(ss))
+    cs = [ctx.convert(c) for c in cs] + [ctx.zero]*(n-len(cs))
+    ss = [ctx.convert(s) for s in ss] + [ctx.zero]*(n-len(ss))
+    x = ctx.convert(x)
+    real = ctx._is_real_type(x) and all(map(ctx._is_real_type, cs+ss))
+    prec = ctx.prec
+    try:
+        ctx.prec += 10 + n.bit_length()
+        m = 2*ctx.pi/(b-a)
+        # With z = exp(j*m*x), c*cos(k*m*x) + s*sin(k*m*x) equals
+        # ((c-j*s)*z**k + (c+j*s)*z**(-k))/2, so the series is a
+        # polynomial in z plus one in 1/z and needs only one exponential.
+        # If x and the coefficients are real, the second polynomial is
+        # the conjugate of the first
+        z = ctx.exp(ctx.j*(m*x))
+        p = ctx.zero
+        for c, s in zip(cs[::-1], ss[::-1]):
+            p = p*z + (c - ctx.j*s)
+        if real:
+            v = ctx._re(p)
+        else:
+            w = 1/z
+            q = ctx.zero
+            for c, s in zip(cs[::-1], ss[::-1]):
+                q = q*w + (c + ctx.j*s)
+            v = (p+q)/2
+    finally:
+        ctx.prec = prec
+    return +v
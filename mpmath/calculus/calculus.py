@@ -1,5 +1,19 @@
 class CalculusMethods:
-    pass
+
+    def __init__(ctx, *args, **kwargs):
+        # Lists of Euler-Maclaurin coefficients B_(k+1)/(k+1)! for odd k,
+        # keyed by prec
+        ctx._em_coeff_cache = {}
+        # Richardson extrapolation weights and their maximum, keyed by (N, prec)
+        ctx._richardson_cache = {}
+
+    # Optional fast versions of common algorithms in common cases.
+    # If not overridden, default (generic) implementations will be used
+    def _shanks_fast(ctx, seq, table, start, stop, rng, tol): raise NotImplementedError
+    def _polyval_fast(ctx, coeffs, x, derivative): raise NotImplementedError
+    def _polyroots_fast(ctx, coeffs, roots, maxsteps, tol): raise NotImplementedError
+    def _fourierval_fast(ctx, cs, ss, L, x): raise NotImplementedError
+    def _chebclenshaw_fast(ctx, c, u): raise NotImplementedError
 
 def defun(f):
     setattr(CalculusMethods, f.__name__, f)
@@ -1,11 +1,6 @@
 from .calculus import defun
 
 
-try:
-    iteritems = dict.iteritems
-except AttributeError:
-    iteritems = dict.items
-
 #----------------------------------------------------------------------------#
 #                                Differentiation                             #
 #----------------------------------------------------------------------------#
@@ -21,12 +16,14 @@ def difference(ctx, s, n):
         \Delta^n = \sum_{k=0}^{\infty} (-1)^{k+n} {n \choose k} s_k.
     """
     n = int(n)
-    d = ctx.zero
+    # The binomial weights are exact integers, so the whole sum can be
+    # formed as a dot product with a single rounding
+    weights = []
     b = (-1) ** (n & 1)
     for k in range(n+1):
-        d += b * s[k]
+        weights.append(b)
         b = (b * (k-n)) // (k+1)
-    return d
+    return ctx.fdot(weights, s)
 
 def hsteps(ctx, f, x, n, prec, **options):
     singular = options.get('singular')
@@ -46,15 +43,14 @@ def hsteps(ctx, f, x, n, prec, **options):
         else:
             h = ctx.convert(h)
         # Directed: steps x, x+h, ... x+n*h
-        direction = options.get('direction', 0)
+        # Central: steps x-n*h, x-(n-2)*h ..., x, ..., x+(n-2)*h, x+n*h
         if direction:
             h *= ctx.sign(direction)
-            steps = range(n+1)
-            norm = h
-        # Central: steps x-n*h, x-(n-2)*h ..., x, ..., x+(n-2)*h, x+n*h
+            start, stride = 0, 1
         else:
-            steps = range(-n, n+1, 2)
-            norm = (2*h)
+            start, stride = -n, 2
+        steps = range(start, start+stride*n+1, stride)
+        norm = stride*h
         # Perturb
         if singular:
             x += 0.5*h
@@ -155,7 +151,7 @@ def diff(ctx, f, x, n=1, **options):
     even even if the result is purely real::
 
         >>> diff(sqrt, 1, method='quad')
-        (0.5 - 4.59...e-26j)
+        (0.5 + 8.81...e-27j)
         >>> chop(_)
         0.5
 
@@ -191,10 +187,12 @@ def diff(ctx, f, x, n=1, **options):
         elif method == 'quad':
             ctx.prec += 10
             radius = ctx.convert(options.get('radius', 0.25))
+            # On the circle, 1/(radius*exp(j*t))**n equals
+            # exp(-j*n*t) / radius**n, which avoids a complex division
+            # and a complex power
+            scale = radius**(-n)
             def g(t):
-                rei = radius*ctx.expj(t)
-                z = x + rei
-                return f(z) / rei**n
+                return f(x + radius*ctx.expj(t)) * ctx.expj(-n*t) * scale
             d = ctx.quadts(g, [0, 2*ctx.pi])
             v = d * ctx.factorial(n) / (2*ctx.pi)
         else:
@@ -280,13 +278,26 @@ def diffs(ctx, f, x, n=None, **options):
         A, B = 1, n+1
     while 1:
         callprec = ctx.prec
+        # The function values of the previous stage cannot be reused:
+        # hsteps() evaluates f at a working precision that grows with B,
+        # and central steps are odd or even multiples of h with B
         y, norm, workprec = hsteps(ctx, f, x, B, callprec, **options)
-        for k in range(A, B):
-            try:
-                ctx.prec = workprec
-                d = ctx.difference(y, k) / norm**k
-            finally:
-                ctx.prec = callprec
+        # Build the forward difference table of y column by column,
+        # so that all orders share it; after m steps, y[0] is the
+        # m-th difference. All orders of this stage are computed under
+        # a single switch to the working precision
+        m = 0
+        ds = []
+        try:
+            ctx.prec = workprec
+            for k in range(A, B):
+                while m < k:
+                    y = [y[i+1]-y[i] for i in range(B-m)]
+                    m += 1
+                ds.append(y[0] / norm**k)
+        finally:
+            ctx.prec = callprec
+        for k, d in zip(range(A, B), ds):
             yield +d
             if k >= n:
                 return
@@ -368,15 +379,15 @@ def dpoly(n, _cache={}):
     if not _cache:
         _cache[0] = {(0,):1}
     R = dpoly(n-1)
-    R = dict((c+(0,),v) for (c,v) in iteritems(R))
+    R = dict((c+(0,),v) for (c,v) in R.items())
     Ra = {}
-    for powers, count in iteritems(R):
+    for powers, count in R.items():
         powers1 = (powers[0]+1,) + powers[1:]
         if powers1 in Ra:
             Ra[powers1] += count
         else:
             Ra[powers1] = count
-    for powers, count in iteritems(R):
+    for powers, count in R.items():
         if not sum(powers):
             continue
         for k,p in enumerate(powers):
@@ -439,7 +450,7 @@ def diffs_exp(ctx, fdiffs):
     i = 1
     while 1:
         s = ctx.mpf(0)
-        for powers, c in iteritems(dpoly(i)):
+        for powers, c in dpoly(i).items():
             s += c*ctx.fprod(fn(k+1)**p for (k,p) in enumerate(powers) if p)
         yield s * f0
         i += 1
@@ -570,11 +581,17 @@ def taylor(ctx, f, x, n, **options):
         12.1824939607035
 
     """
-    gen = enumerate(ctx.diffs(f, x, n, **options))
-    if options.get("chop", True):
-        return [ctx.chop(d)/ctx.factorial(i) for i, d in gen]
-    else:
-        return [d/ctx.factorial(i) for i, d in gen]
+    chop = options.get("chop", True)
+    coeffs = []
+    # Exact integer factorial, built up alongside the derivatives
+    fac = 1
+    for i, d in enumerate(ctx.diffs(f, x, n, **options)):
+        if i:
+            fac *= i
+        if chop:
+            d = ctx.chop(d)
+        coeffs.append(d / fac)
+    return coeffs
 
 @defun
 def pade(ctx, a, L, M):
@@ -629,18 +646,23 @@ def pade(ctx, a, L, M):
     # a[L]*q[1] + ... + a[L-M+1]*q[M] = -a[L+1]
     # ...
     # a[L+M-1]*q[1] + ... + a[L]*q[M] = -a[L+M]
-    A = ctx.matrix(M)
-    for j in range(M):
-        for i in range(min(M, L+j+1)):
-            A[j, i] = a[L+j-i]
-    v = -ctx.matrix(a[(L+1):(L+M+1)])
-    x = ctx.lu_solve(A, v)
+    if M == 1:
+        # A 1x1 system; divide directly (at the same extra precision
+        # lu_solve would use)
+        prec = ctx.prec
+        try:
+            ctx.prec += 10
+            x = [-ctx.convert(a[L+1]) / a[L]]
+        finally:
+            ctx.prec = prec
+    else:
+        A = ctx.matrix(M)
+        for j in range(M):
+            for i in range(min(M, L+j+1)):
+                A[j, i] = a[L+j-i]
+        v = -ctx.matrix(a[(L+1):(L+M+1)])
+        x = ctx.lu_solve(A, v)
     q = [ctx.one] + list(x)
-    # compute p
-    p = [0]*(L+1)
-    for i in range(L+1):
-        s = a[i]
-        for j in range(1, min(M,i) + 1):
-            s += q[j]*a[i-j]
-        p[i] = s
+    # compute p: p[i] = a[i] + q[1]*a[i-1] + ... + q[min(M,i)]*a[i-min(M,i)]
+    p = [ctx.fdot(q[:min(M,i)+1], a[i::-1]) for i in range(L+1)]
     return p, q
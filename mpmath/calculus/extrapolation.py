@@ -1,6 +1,26 @@
+from itertools import accumulate, count, islice, product
+
 from .calculus import defun
 
 
+def _richardson_weights(ctx, N):
+    # The general weight is c[k] = (N+k)**N * (-1)**(k+N) / k! / (N-k)!
+    # To avoid repeated factorials, we simplify the quotient
+    # of successive weights to obtain a recurrence relation. The powers
+    # (k+N)**N are exact integers, so they are computed as such and
+    # each one is reused in the following step.
+    c = (-1)**N * N**N / ctx.mpf(ctx._ifac(N))
+    p = N**N
+    weights = []
+    for k in range(N+1):
+        weights.append(c)
+        q = (k+N+1)**N
+        c *= (k-N)*q
+        c /= (1+k)*p
+        p = q
+    # Since |c[0]| = N**N / N! >= 1, this is never below 1
+    return weights, max(map(abs, weights))
+
 @defun
 def richardson(ctx, seq):
     r"""
@@ -58,7 +78,7 @@ def richardson(ctx, seq):
 
         >>> v, c = richardson(S[:30])
         >>> v
-        3.14159265468624052829954206226
+        3.141592654686240528299542066
         >>> nprint([v-pi, c])
         [1.09645e-9, 20833.3]
 
@@ -69,24 +89,27 @@ def richardson(ctx, seq):
     """
     if len(seq) < 3:
         raise ValueError("seq should be of minimum length 3")
-    if ctx.sign(seq[-1]-seq[-2]) != ctx.sign(seq[-2]-seq[-3]):
+    x, y, z = seq[-3:]
+    # Compare directly when possible rather than taking the signs
+    # of the differences; that is only needed for complex numbers
+    try:
+        oscillating = ((z > y) - (z < y)) != ((y > x) - (y < x))
+    except TypeError:
+        oscillating = ctx.sign(z-y) != ctx.sign(y-x)
+    if oscillating:
         seq = seq[::2]
     N = len(seq)//2-1
-    s = ctx.zero
-    # The general weight is c[k] = (N+k)**N * (-1)**(k+N) / k! / (N-k)!
-    # To avoid repeated factorials, we simplify the quotient
-    # of successive weights to obtain a recurrence relation
-    c = (-1)**N * N**N / ctx.mpf(ctx._ifac(N))
-    maxc = 1
-    for k in range(N+1):
-        s += c * seq[N+k]
-        maxc = max(abs(c), maxc)
-        c *= (k-N)*ctx.mpf(k+N+1)**N
-        c /= ((1+k)*ctx.mpf(k+N)**N)
-    return s, maxc
+    # The weights only depend on N and the precision, and adaptive
+    # extrapolation typically asks for the same N repeatedly
+    key = N, ctx.prec
+    weights = ctx._richardson_cache.get(key)
+    if weights is None:
+        weights = ctx._richardson_cache[key] = _richardson_weights(ctx, N)
+    c, maxc = weights
+    return ctx.fdot(c, seq[N:2*N+1]), maxc
 
 @defun
-def shanks(ctx, seq, table=None, randomized=False):
+def shanks(ctx, seq, table=None, randomized=False, tol=None):
     r"""
     Given a list ``seq`` of the first `N` elements of a slowly
     convergent infinite sequence `(A_k)`, :func:`~mpmath.shanks` computes the iterated
@@ -121,6 +144,12 @@ def shanks(ctx, seq, table=None, randomized=False):
     new elements have been appended to the sequence. The table will
     then be updated in-place.
 
+    If *tol* is given, the extension stops as soon as a row is
+    completed whose last element differs from the third last element
+    by at most *tol*, since the remaining rows are not needed for an
+    estimate of that accuracy. Passing the table back in along with
+    the sequence continues the computation from that point.
+
     **The Shanks transformation**
 
     The Shanks transformation is defined as follows (see [2]): given
@@ -230,6 +259,12 @@ def shanks(ctx, seq, table=None, randomized=False):
         from random import Random
         rnd = Random()
         rnd.seed(START)
+    else:
+        rnd = None
+    try:
+        return ctx._shanks_fast(seq, table, START, STOP, rnd, tol)
+    except NotImplementedError:
+        pass
     for i in range(START, STOP):
         row = []
         for j in range(i+1):
@@ -250,6 +285,9 @@ def shanks(ctx, seq, table=None, randomized=False):
                     return table
             row.append(a + one/b)
         table.append(row)
+        if tol is not None and i & 1 and i > 1 and \
+            abs(row[-1] - row[-3]) <= tol:
+            break
     return table
 
 
@@ -1038,25 +1076,32 @@ def sumem(ctx, f, interval, tol=None, reject=10, integral=None,
     try:
         ctx.prec += 10
         s = ctx.zero
-        for k, (da, db) in enumerate(zip(adiffs, bdiffs)):
-            if k & 1:
-                term = (db-da) * ctx.bernoulli(k+1) / ctx.factorial(k+1)
-                mag = abs(term)
+        # Coefficients for k = 1, 3, 5, ..., extended as needed
+        coeffs = ctx._em_coeff_cache.setdefault(ctx.prec, [])
+        def em_term(k, da, db):
+            i = k // 2
+            if i == len(coeffs):
+                coeffs.append(ctx.bernoulli(k+1) / ctx.factorial(k+1))
+            return k, (db-da) * coeffs[i]
+        # Only the odd-order derivatives enter the formula
+        for k, term in map(em_term, count(1, 2),
+            islice(adiffs, 1, None, 2), islice(bdiffs, 1, None, 2)):
+            mag = abs(term)
+            if verbose:
+                print("term", k, "magnitude =", ctx.nstr(mag))
+            if k > 4 and mag < tol:
+                s += term
+                break
+            elif k > 4 and abs(prev) / mag < reject:
+                err += mag
+                if _fast_abort:
+                    return [s, (s, err)][error]
                 if verbose:
-                    print("term", k, "magnitude =", ctx.nstr(mag))
-                if k > 4 and mag < tol:
-                    s += term
-                    break
-                elif k > 4 and abs(prev) / mag < reject:
-                    err += mag
-                    if _fast_abort:
-                        return [s, (s, err)][error]
-                    if verbose:
-                        print("Failed to converge")
-                    break
-                else:
-                    s += term
-                prev = term
+                    print("Failed to converge")
+                break
+            else:
+                s += term
+            prev = term
         # Endpoint correction
         if a != ctx.ninf: s += f(a)/2
         if b != ctx.inf: s += f(b)/2
@@ -1183,7 +1228,11 @@ def init_levin(m):
                     error = richardson_error
                     best = value
             if TRY_SHANKS:
-                shanks_table = ctx.shanks(partial, shanks_table, randomized=True)
+                # Only stop extending the table early once the estimate
+                # has converged well beyond the tolerance, so that the
+                # truncated table is as good as the full one
+                shanks_table = ctx.shanks(partial, shanks_table,
+                    randomized=True, tol=tol/2**10)
                 row = shanks_table[-1]
                 if len(row) == 2:
                     est1 = row[-1]
@@ -1212,7 +1261,13 @@ def init_levin(m):
                     error = lerror
                     best = est
             if TRY_EULER_MACLAURIN:
-                if ctx.almosteq(ctx.mpc(ctx.sign(partial[-1]) / ctx.sign(partial[-2])), -1):
+                a, b = partial[-2], partial[-1]
+                # A plain comparison suffices for real partial sums
+                try:
+                    alternating = (a < 0 < b) or (b < 0 < a)
+                except TypeError:
+                    alternating = ctx.almosteq(ctx.mpc(ctx.sign(b) / ctx.sign(a)), -1)
+                if alternating:
                     if verbose:
                         print ("NOT using Euler-Maclaurin: the series appears"
                             " to be alternating, so numerical\n quadrature"
@@ -1686,16 +1741,17 @@ def nsum(ctx, f, *intervals, **options):
     """
     infinite, g = standardize(ctx, f, intervals, options)
     if not infinite:
-        return +g()
+        # Already rounded by fsum() at the working precision
+        return g()
 
     def update(partial_sums, indices):
         if partial_sums:
             psum = partial_sums[-1]
         else:
             psum = ctx.zero
-        for k in indices:
-            psum = psum + g(ctx.mpf(k))
-            partial_sums.append(psum)
+        # Evaluate the whole batch of terms before forming the running sums
+        terms = [g(ctx.mpf(k)) for k in indices]
+        partial_sums.extend(islice(accumulate(terms, initial=psum), 1, None))
 
     prec = ctx.prec
 
@@ -1744,29 +1800,37 @@ def g(k):
             return f(*args)
         return True, g
 
-# backwards compatible itertools.product
-def cartesian_product(args):
-    pools = map(tuple, args)
-    result = [[]]
-    for pool in pools:
-        result = [x+[y] for x in result for y in pool]
-    for prod in result:
-        yield tuple(prod)
-
 def fold_finite(ctx, f, intervals):
     if not intervals:
         return f
     indices = [v[0] for v in intervals]
     points = [v[1] for v in intervals]
-    ranges = [range(a, b+1) for (a,b) in points]
+    # The finite ranges are traversed once for every term of an outer
+    # infinite sum, so convert the indices to mpfs only once
+    ranges = [[ctx.mpf(k) for k in range(a, b+1)] for (a,b) in points]
     def g(*args):
         args = list(args)
-        s = ctx.zero
-        for xs in cartesian_product(ranges):
+        types = (ctx.mpf, ctx.mpc)
+        terms = []
+        xss = product(*ranges)
+        for xs in xss:
             for dim, x in zip(indices, xs):
-                args[dim] = ctx.mpf(x)
-            s += f(*args)
-        return s
+                args[dim] = x
+            t = f(*args)
+            if type(t) not in types:
+                try:
+                    t = ctx.convert(t)
+                except (TypeError, ValueError):
+                    # Something other than a number (e.g. a matrix);
+                    # add the rest generically
+                    s = ctx.fsum(terms) + t
+                    for xs in xss:
+                        for dim, x in zip(indices, xs):
+                            args[dim] = x
+                        s += f(*args)
+                    return s
+            terms.append(t)
+        return ctx.fsum(terms)
     #print "Folded finite", indices
     return g
 
@@ -2098,8 +2162,7 @@ def limit(ctx, f, x, direction=1, exp=False, **kwargs):
         g = lambda k: h(2**k)
 
     def update(values, indices):
-        for k in indices:
-            values.append(g(k+1))
+        values.extend(g(k+1) for k in indices)
 
     # XXX: steps used by nsum don't work well
     if 'steps' not in kwargs:
@@ -7,8 +7,8 @@ class ODEMethods:
 def ode_taylor(ctx, derivs, x0, y0, tol_prec, n):
     h = tol = ctx.ldexp(1, -tol_prec)
     dim = len(y0)
-    xs = [x0]
-    ys = [y0]
+    # The points of each component, stored separately
+    cols = [[yk] for yk in y0]
     x = x0
     y = y0
     orig = ctx.prec
@@ -17,26 +17,22 @@ def ode_taylor(ctx, derivs, x0, y0, tol_prec, n):
         # Use n steps with Euler's method to get
         # evaluation points for derivatives
         for i in range(n):
-            fxy = derivs(x, y)
-            y = [y[i]+h*fxy[i] for i in range(len(y))]
+            y = [yk + h*fk for yk, fk in zip(y, derivs(x, y))]
             x += h
-            xs.append(x)
-            ys.append(y)
+            for col, yk in zip(cols, y):
+                col.append(yk)
         # Compute derivatives
         ser = [[] for d in range(dim)]
+        # Binomial weights (-1)**(j-i) * C(j,i) of the j-th difference
+        weights = [1]
         for j in range(n+1):
-            s = [0]*dim
-            b = (-1) ** (j & 1)
-            k = 1
-            for i in range(j+1):
-                for d in range(dim):
-                    s[d] += b * ys[i][d]
-                b = (b * (j-k+1)) // (-k)
-                k += 1
             scale = h**(-j) / ctx.fac(j)
             for d in range(dim):
-                s[d] = s[d] * scale
-                ser[d].append(s[d])
+                s = 0
+                for b, yk in zip(weights, cols[d]):
+                    s += b * yk
+                ser[d].append(s * scale)
+            weights = [b-a for a, b in zip(weights + [0], [0] + weights)]
     finally:
         ctx.prec = orig
     # Estimate radius for which we can get full accuracy.
@@ -1,6 +1,6 @@
 import warnings
 
-from .calculus import defun
+from .calculus import CalculusMethods, defun
 
 
 #----------------------------------------------------------------------------#
@@ -44,16 +44,24 @@ def polyval(ctx, coeffs, x, derivative=False, asc=None):
                       DeprecationWarning)
         asc = False
         coeffs = coeffs[::-1]
+    # Only contexts that override the hook get to try it, so that
+    # others do not pay for raising and catching NotImplementedError
+    if len(coeffs) > 1 and \
+            type(ctx)._polyval_fast is not CalculusMethods._polyval_fast:
+        try:
+            return ctx._polyval_fast(coeffs, x, derivative)
+        except NotImplementedError:
+            pass
     p = ctx.convert(coeffs[-1])
     q = ctx.zero
-    for c in reversed(coeffs[:-1]):
-        if derivative:
-            q = p + x*q
-        p = c + x*p
     if derivative:
+        for c in reversed(coeffs[:-1]):
+            q = p + x*q
+            p = c + x*p
         return p, q
-    else:
-        return p
+    for c in reversed(coeffs[:-1]):
+        p = c + x*p
+    return p
 
 @defun
 def polyroots(ctx, coeffs, maxsteps=50, cleanup=True, extraprec=10,
@@ -190,7 +198,6 @@ def polyroots(ctx, coeffs, maxsteps=50, cleanup=True, extraprec=10,
             coeffs = [ctx.convert(c) for c in coeffs]
         else:
             coeffs = [c/lead for c in coeffs]
-        f = lambda x: ctx.polyval(coeffs, x, asc=True)
         if roots_init is None:
             roots = [ctx.mpc((0.4+0.9j)**n) for n in range(deg)]
         else:
@@ -199,22 +206,32 @@ def polyroots(ctx, coeffs, maxsteps=50, cleanup=True, extraprec=10,
             roots[:deg_init] = list(roots_init[:deg_init])
             roots[deg_init:] = [ctx.mpc((0.4+0.9j)**n) for n
                                 in range(deg_init,deg)]
-        err = [ctx.one for n in range(deg)]
         # Durand-Kerner iteration until convergence
-        for step in range(maxsteps):
-            if abs(max(err)) < tol:
-                break
-            for i in range(deg):
-                p = roots[i]
-                x = f(p)
-                for j in range(deg):
-                    if i != j:
-                        try:
-                            x /= (p-roots[j])
-                        except ZeroDivisionError:
-                            continue
-                roots[i] = p - x
-                err[i] = abs(x)
+        try:
+            roots, err = ctx._polyroots_fast(coeffs, roots, maxsteps, tol)
+        except NotImplementedError:
+            # Horner's scheme, specialized to the fixed monic coefficients
+            rcoeffs = coeffs[-2::-1]
+            def f(x):
+                p = ctx.one
+                for c in rcoeffs:
+                    p = c + x*p
+                return p
+            err = [ctx.one for n in range(deg)]
+            for step in range(maxsteps):
+                if abs(max(err)) < tol:
+                    break
+                for i in range(deg):
+                    p = roots[i]
+                    x = f(p)
+                    for j in range(deg):
+                        if i != j:
+                            try:
+                                x /= (p-roots[j])
+                            except ZeroDivisionError:
+                                continue
+                    roots[i] = p - x
+                    err[i] = abs(x)
         if abs(max(err)) >= tol:
             raise ctx.NoConvergence("Didn't converge in maxsteps=%d steps." \
                     % maxsteps)
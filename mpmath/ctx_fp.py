@@ -148,6 +148,25 @@ def convert(ctx, x):
     arg = staticmethod(cmath.phase)
     loggamma = staticmethod(libfp.loggamma)
 
+    def _fourierval_fast(ctx, cs, ss, L, x):
+        # Horner's scheme in exp(j*m*x) directly on Python numbers; see
+        # fourierval()
+        n = max(len(cs), len(ss))
+        cs = list(cs) + [0.0]*(n-len(cs))
+        ss = list(ss) + [0.0]*(n-len(ss))
+        z = cmath.exp(2j*math.pi*x/L)
+        p = 0j
+        for c, s in zip(reversed(cs), reversed(ss)):
+            p = p*z + (c - 1j*s)
+        if type(x) is not complex and \
+                not any(type(c) is complex for c in cs + ss):
+            return p.real
+        w = 1/z
+        q = 0j
+        for c, s in zip(reversed(cs), reversed(ss)):
+            q = q*w + (c + 1j*s)
+        return (p+q)/2
+
     def expj(ctx, x):
         return ctx.exp(ctx.j*x)
 
@@ -10,13 +10,16 @@
 from . import function_docs, libmp
 from .ctx_base import StandardBaseContext
 from .libmp import (MPQ, MPZ_ONE, ComplexResult, dps_to_prec, finf, fnan,
-                    fninf, fone, from_rational, fzero, int_types, mpc_add,
-                    mpc_add_mpf, mpc_div, mpc_div_mpf, mpc_mul, mpc_mul_mpf,
-                    mpc_neg, mpc_sub, mpc_sub_mpf, mpc_to_str, mpf_add,
-                    mpf_apery, mpf_catalan, mpf_degree, mpf_div, mpf_e,
-                    mpf_euler, mpf_glaisher, mpf_khinchin, mpf_ln2, mpf_ln10,
-                    mpf_mertens, mpf_mul, mpf_neg, mpf_phi, mpf_pi, mpf_rand,
-                    mpf_sub, mpf_twinprime, repr_dps, to_man_exp, to_str)
+                    fninf, fone, from_int, from_rational, fzero, int_types,
+                    mpc_abs, mpc_add, mpc_add_mpf, mpc_div, mpc_div_mpf,
+                    mpc_mul, mpc_mul_int, mpc_mul_mpf, mpc_neg, mpc_sub,
+                    mpc_sub_mpf, mpc_to_str, mpf_abs, mpf_add, mpf_apery,
+                    mpf_catalan, mpf_cos_sin, mpf_degree, mpf_div, mpf_e,
+                    mpf_euler, mpf_glaisher, mpf_khinchin, mpf_le, mpf_ln2,
+                    mpf_ln10, mpf_lt, mpf_mertens, mpf_mul, mpf_mul_int,
+                    mpf_neg, mpf_phi, mpf_pi, mpf_pos, mpf_rand, mpf_rdiv_int,
+                    mpf_shift, mpf_sub, mpf_twinprime, repr_dps, to_man_exp,
+                    to_str)
 
 
 get_complex = re.compile(r"""
@@ -1171,14 +1174,60 @@ def fprod(ctx, factors):
             mpf('7.0')
 
         """
-        orig = ctx.prec
-        try:
-            v = ctx.one
-            for p in factors:
-                v *= p
-        finally:
-            ctx.prec = orig
-        return +v
+        prec, rnd = ctx._prec_rounding
+        wp = prec + 10
+        types = (ctx.mpf, ctx.mpc)
+        re = fone
+        im = None
+        # Python integers are multiplied together exactly and only folded
+        # into the floating-point product once they fill the working
+        # precision, which saves one conversion and rounding per factor
+        n = 1
+        factors = iter(factors)
+        for p in factors:
+            if type(p) is int:
+                n *= p
+                if n.bit_length() > wp:
+                    if im is None:
+                        re = mpf_mul_int(re, n, wp, rnd)
+                    else:
+                        re, im = mpc_mul_int((re, im), n, wp, rnd)
+                    n = 1
+                continue
+            if type(p) not in types:
+                try:
+                    p = ctx.convert(p, strings=False)
+                except (TypeError, ValueError):
+                    pass
+            if hasattr(p, "_mpf_"):
+                if im is None:
+                    re = mpf_mul(re, p._mpf_, wp, rnd)
+                else:
+                    re, im = mpc_mul_mpf((re, im), p._mpf_, wp, rnd)
+            elif hasattr(p, "_mpc_"):
+                if im is None:
+                    re, im = mpc_mul_mpf(p._mpc_, re, wp, rnd)
+                else:
+                    re, im = mpc_mul((re, im), p._mpc_, wp, rnd)
+            else:
+                # Something other than a number (e.g. a matrix or an
+                # interval); multiply the rest generically
+                if im is None:
+                    v = ctx.make_mpf(mpf_mul_int(re, n, wp, rnd))
+                else:
+                    v = ctx.make_mpc(mpc_mul_int((re, im), n, wp, rnd))
+                orig = ctx.prec
+                try:
+                    ctx.prec = wp
+                    v *= p
+                    for p in factors:
+                        v *= p
+                finally:
+                    ctx.prec = orig
+                return +v
+        if im is None:
+            return ctx.make_mpf(mpf_mul_int(re, n, prec, rnd))
+        return ctx.make_mpc(mpc_mul_int((re, im), n, prec, rnd))
 
     def rand(ctx):
         """
@@ -1237,6 +1286,189 @@ def _zetasum(ctx, s, a, b):
         return v
     '''
 
+    def _shanks_fast(ctx, seq, table, start, stop, rng, tol):
+        # Wynn epsilon algorithm on raw mpf tuples; see shanks()
+        mpf = ctx.mpf
+        if table:
+            prev = table[-1]
+        else:
+            prev = []
+        for x in seq[start:stop+1]:
+            if type(x) is not mpf:
+                raise NotImplementedError
+        for x in prev:
+            if type(x) is not mpf:
+                raise NotImplementedError
+        prec, rounding = ctx._prec_rounding
+        make_mpf = ctx.make_mpf
+        prev = [x._mpf_ for x in prev]
+        if tol is not None:
+            tol = ctx.convert(tol)._mpf_
+        for i in range(start, stop):
+            row = []
+            for j in range(i+1):
+                if j == 0:
+                    a, b = fzero, mpf_sub(seq[i+1]._mpf_, seq[i]._mpf_, prec, rounding)
+                else:
+                    if j == 1:
+                        a = seq[i]._mpf_
+                    else:
+                        a = prev[j-2]
+                    b = mpf_sub(row[j-1], prev[j-1], prec, rounding)
+                if b == fzero:
+                    if rng:
+                        b = from_int(1 + rng.getrandbits(10))
+                        b = mpf_shift(b, 1-prec)
+                    elif i & 1:
+                        return table[:-1]
+                    else:
+                        return table
+                row.append(mpf_add(a, mpf_rdiv_int(1, b, prec, rounding), prec, rounding))
+            table.append([make_mpf(x) for x in row])
+            if tol is not None and i & 1 and i > 1 and \
+                mpf_le(mpf_abs(mpf_sub(row[-1], row[-3], prec, rounding)), tol):
+                break
+            prev = row
+        return table
+
+    def _polyval_fast(ctx, coeffs, x, derivative):
+        # Horner's scheme on raw mpf or mpc tuples; see polyval()
+        prec, rounding = ctx._prec_rounding
+        types = (ctx.mpf, ctx.mpc)
+        real = []
+        imag = []
+        # As in the generic loop, the derivative is only complex if x or
+        # one of the coefficients it depends on (all but the constant
+        # term) is complex
+        is_complex = dq_complex = False
+        for i, c in enumerate(list(coeffs) + [x]):
+            if type(c) not in types:
+                try:
+                    c = ctx.convert(c)
+                except (TypeError, ValueError):
+                    raise NotImplementedError
+            if hasattr(c, "_mpf_"):
+                real.append(c._mpf_)
+                imag.append(fzero)
+            elif hasattr(c, "_mpc_"):
+                re, im = c._mpc_
+                real.append(re)
+                imag.append(im)
+                is_complex = True
+                dq_complex = dq_complex or i > 0
+            else:
+                raise NotImplementedError
+        x = real.pop(), imag.pop()
+        if not is_complex:
+            x = x[0]
+            p = real[-1]
+            q = fzero
+            if derivative:
+                for c in reversed(real[:-1]):
+                    q = mpf_add(p, mpf_mul(x, q, prec, rounding), prec, rounding)
+                    p = mpf_add(c, mpf_mul(x, p, prec, rounding), prec, rounding)
+                return ctx.make_mpf(p), ctx.make_mpf(q)
+            for c in reversed(real[:-1]):
+                p = mpf_add(c, mpf_mul(x, p, prec, rounding), prec, rounding)
+            return ctx.make_mpf(p)
+        p = real[-1], imag[-1]
+        q = fzero, fzero
+        coeffs = list(zip(real[:-1], imag[:-1]))
+        if derivative:
+            for c in reversed(coeffs):
+                q = mpc_add(p, mpc_mul(x, q, prec, rounding), prec, rounding)
+                p = mpc_add(c, mpc_mul(x, p, prec, rounding), prec, rounding)
+            if dq_complex:
+                return ctx.make_mpc(p), ctx.make_mpc(q)
+            return ctx.make_mpc(p), ctx.make_mpf(q[0])
+        for c in reversed(coeffs):
+            p = mpc_add(c, mpc_mul(x, p, prec, rounding), prec, rounding)
+        return ctx.make_mpc(p)
+
+    def _chebclenshaw_fast(ctx, c, u):
+        # Clenshaw's recurrence on raw mpf tuples for real coefficients;
+        # see chebclenshaw()
+        prec, rounding = ctx._prec_rounding
+        if not (hasattr(u, "_mpf_") and
+                all(hasattr(ck, "_mpf_") for ck in c)):
+            raise NotImplementedError
+        u = u._mpf_
+        u2 = mpf_shift(u, 1)
+        b1 = b2 = fzero
+        for ck in c[:0:-1]:
+            b1, b2 = mpf_add(mpf_sub(mpf_mul(u2, b1, prec, rounding), b2,
+                prec, rounding), ck._mpf_, prec, rounding), b1
+        v = mpf_sub(mpf_mul(u, b1, prec, rounding), b2, prec, rounding)
+        v = mpf_add(v, mpf_shift(c[0]._mpf_, -1), prec, rounding)
+        return ctx.make_mpf(v)
+
+    def _fourierval_fast(ctx, cs, ss, L, x):
+        # Horner's scheme in exp(j*m*x) on raw tuples for a real series
+        # at a real point; see fourierval()
+        prec, rounding = ctx._prec_rounding
+        n = max(len(cs), len(ss))
+        values = []
+        for v in list(cs) + [0]*(n-len(cs)) + list(ss) + [0]*(n-len(ss)) + \
+                [x, L]:
+            if type(v) is not ctx.mpf:
+                v = ctx.convert(v)
+            if not hasattr(v, "_mpf_"):
+                raise NotImplementedError
+            values.append(v._mpf_)
+        L = values.pop()
+        x = values.pop()
+        wp = prec + 10 + n.bit_length()
+        m = mpf_div(mpf_shift(mpf_pi(wp), 1), L, wp)
+        z = mpf_cos_sin(mpf_mul(m, x, wp), wp)
+        p = fzero, fzero
+        for c, s in zip(values[n-1::-1], values[:n-1:-1]):
+            p = mpc_add(mpc_mul(p, z, wp), (c, mpf_neg(s)), wp)
+        return ctx.make_mpf(mpf_pos(p[0], prec, rounding))
+
+    def _polyroots_fast(ctx, coeffs, roots, maxsteps, tol):
+        # Durand-Kerner iteration on raw mpc tuples; see polyroots().
+        # The differences p-roots[j] are multiplied together so that
+        # each step needs a single complex division
+        prec, rounding = ctx._prec_rounding
+        types = (ctx.mpf, ctx.mpc)
+        czero = fzero, fzero
+        values = []
+        for x in list(coeffs) + list(roots):
+            if type(x) not in types:
+                x = ctx.convert(x)
+            if hasattr(x, "_mpf_"):
+                values.append((x._mpf_, fzero))
+            elif hasattr(x, "_mpc_"):
+                values.append(x._mpc_)
+            else:
+                raise NotImplementedError
+        deg = len(roots)
+        coeffs = values[deg::-1]
+        roots = values[-deg:]
+        tol = tol._mpf_
+        err = [fone] * deg
+        for step in range(maxsteps):
+            for e in err:
+                if not mpf_lt(e, tol):
+                    break
+            else:
+                break
+            for i in range(deg):
+                p = roots[i]
+                x = coeffs[0]
+                for c in coeffs[1:]:
+                    x = mpc_add(c, mpc_mul(p, x, prec, rounding), prec, rounding)
+                d = fone, fzero
+                for j in range(deg):
+                    if i != j:
+                        t = mpc_sub(p, roots[j], prec, rounding)
+                        if t != czero:
+                            d = mpc_mul(d, t, prec, rounding)
+                x = mpc_div(x, d, prec, rounding)
+                roots[i] = mpc_sub(p, x, prec, rounding)
+                err[i] = mpc_abs(x, prec, rounding)
+        return [ctx.make_mpc(z) for z in roots], [ctx.make_mpf(e) for e in err]
+
     def _zetasum_fast(ctx, s, a, n, derivatives=[0], reflect=False):
         if not (ctx.isint(a) and hasattr(s, "_mpc_")):
             raise NotImplementedError
@@ -980,7 +980,17 @@ def fsum(ctx, terms, absolute=False, squared=False):
         prec, rnd = ctx._prec_rounding
         real = []
         imag = []
+        # Python integers are summed exactly and converted only once
+        n = 0
         for term in terms:
+            if type(term) is int:
+                if squared:
+                    n += term*term
+                elif absolute:
+                    n += abs(term)
+                else:
+                    n += term
+                continue
             reval = imval = 0
             if hasattr(term, "_mpf_"):
                 reval = term._mpf_
@@ -1014,6 +1024,8 @@ def fsum(ctx, terms, absolute=False, squared=False):
                 elif absolute:
                     reval = mpf_abs(reval)
                 real.append(reval)
+        if n:
+            real.append(from_int(n))
         s = mpf_sum(real, prec, rnd, absolute)
         if imag:
             s = ctx.make_mpc((s, mpf_sum(imag, prec, rnd)))
@@ -1,8 +1,9 @@
 import pytest
 
-from mpmath import (arange, chebyfit, cos, differint, e, euler, exp, fourier,
-                    fourierval, inf, invertlaplace, j, limit, log, matrix, mp,
-                    mpf, pade, pi, polyroots, polyval, sin, sqrt)
+from mpmath import (arange, chebyfit, chebyt, cos, differint, e, euler, exp,
+                    fourier, fourierval, fp, inf, invertlaplace, iv, j, limit,
+                    log, matrix, mp, mpf, pade, pi, polyroots, polyval, sin,
+                    sqrt)
 
 
 def test_approximation():
@@ -13,6 +14,25 @@ def test_approximation():
         x = 2 + i/5.
         assert abs(polyval(p, x, asc=True) - f(x)) < err
 
+def test_chebyfit_monomial_error():
+    # The estimate must include the error of the expanded polynomial
+    f = lambda x: exp(x)*sin(3*x)
+    p, err = chebyfit(f, [0, 2], 60, error=True, asc=True)
+    with mp.workdps(60):
+        true_err = max(abs(f(x) - polyval(p, x, asc=True))
+                       for x in arange(0, 2, 0.01))
+    assert true_err/2 < err < 2*true_err
+
+def test_chebyfit_chebyshev_basis():
+    f = lambda x: cos(2-2*x)/x
+    c, err = chebyfit(f, [2, 4], 8, error=True, basis='chebyshev')
+    assert len(c) == 8 and err < 1e-5
+    for i in range(10):
+        x = 2 + i/5.
+        y = sum(ck*chebyt(k, x-3) for k, ck in enumerate(c))
+        assert abs(y - f(x)) < err
+    pytest.raises(ValueError, lambda: chebyfit(f, [2, 4], 8, basis='x'))
+
 def test_chebyfit_deprecated():
     f = lambda x: cos(2-2*x)/x
     with pytest.deprecated_call():
@@ -35,6 +55,15 @@ def test_polyval():
     p = [5, -2, 0, 4]
     assert polyval(p,4,asc=True) == 253
     assert polyval(p,4,derivative=True,asc=True) == (253, 190)
+    assert polyval(p,2j,asc=True) == 5-36j
+    assert polyval(p,2j,derivative=True,asc=True) == (5-36j, -50)
+    assert polyval([1j,0,1],1+1j,derivative=True,asc=True) == (3j, 2+2j)
+    assert polyval((mpf(1)/4, 2), 3, asc=True) == 6.25
+    v, d = polyval([1j, 2, 3], 2, derivative=True, asc=True)
+    assert (v, d) == (16+1j, 14) and type(d) is mpf
+    assert polyval([1, 2, 3], iv.mpf([1, 2]), asc=True) == iv.mpf([6, 17])
+    assert polyval([1, 2], matrix([[1, 0], [0, 1]]), asc=True) == \
+        matrix([[3, 1], [1, 3]])
 
 def test_polyval_deprecated():
     with pytest.deprecated_call():
@@ -183,6 +212,15 @@ def test_pade():
     for x in arange(0, 1, 0.1):
         r = polyval(p, x, asc=True)/polyval(q, x, asc=True)
         assert r.ae(exp(x), 1.0e-10)
+    p, q = pade(a, N-1, 1)
+    assert q[0] == 1 and q[1].ae(-one/N)
+    for x in arange(0, 1, 0.1):
+        r = polyval(p, x, asc=True)/polyval(q, x, asc=True)
+        assert r.ae(exp(x), 1.0e-7)
+    p, q = fp.pade([1, 1, 0.5, 1/6.], 2, 1)
+    assert fp.almosteq(q[1], -1/3.)
+    p, q = iv.pade([1, 1, 0.5, 1/6.], 2, 1)
+    assert -2*mpf(1/6.) in q[1]
 
 def test_fourier():
     c, s = fourier(lambda x: x+1, [-1, 2], 2)
@@ -194,6 +232,19 @@ def test_fourier():
     assert s[1].ae(3/(2*pi))
     assert s[2].ae(3/(4*pi))
     assert fourierval((c, s), [-1, 2], 1).ae(1.9134966715663442)
+    v = iv.fourierval((c, s), [-1, 2], 1)
+    assert fourierval((c, s), [-1, 2], 1) in v and v.delta < 1e-14
+    cs = [float(x) for x in c], [float(x) for x in s]
+    assert fp.almosteq(fp.fourierval(cs, [-1, 2], 1), 1.9134966715663442)
+    assert fp.almosteq(fp.fourierval(cs, [-1, 2], 1+0.5j),
+                       fourierval((c, s), [-1, 2], 1+0.5j))
+    c, s = fourier(cos, [-pi, pi], 2, symmetry='even')
+    assert s == [0, 0, 0]
+    assert c[1].ae(1) and abs(c[2]) < 1e-14
+    c, s = fourier(lambda x: x**3, [-1, 1], 2, symmetry='odd')
+    assert c == [0, 0, 0]
+    assert s[1].ae(fourier(lambda x: x**3, [-1, 1], 2)[1][1])
+    pytest.raises(ValueError, lambda: fourier(cos, [-pi, pi], 2, symmetry=1))
 
 def test_differint():
     assert differint(lambda t: t, 2, -0.5).ae(8*sqrt(2/pi)/3)
@@ -74,6 +74,7 @@ def test_constants():
             assert mertens == mpf(tmertens)
             assert twinprime == mpf(ttwinprime)
     mp.dps = 15
+    assert repr(khinchin) == "<Khinchin's constant: 2.68545~>"
     assert pi >= -1
     assert pi > 2
     assert pi > 3
@@ -1,5 +1,6 @@
 from mpmath import (e, exp, fac, factorial, fp, fprod, fsum, inf, isnan, iv, j,
-                    log, mpi, nprod, nsum, pi, sumem)
+                    log, matrix, mpf, mpi, nprod, nsum, pi, richardson, shanks,
+                    sumem)
 
 
 def test_sumem():
@@ -8,6 +9,8 @@ def test_sumem():
 
 def test_nsum():
     assert nsum(lambda x: x**2, [1, 3]) == 14
+    assert nsum(lambda k: [1, 2**-80, -1][int(k)], [0, 2]) == 2**-80
+    assert nsum(lambda k: matrix([[k, 1]]), [1, 3]) == matrix([[6, 3]])
     assert nsum(lambda k: 1/factorial(k), [0, inf]).ae(e)
     assert nsum(lambda k: (-1)**(k+1) / k, [1, inf]).ae(log(2))
     assert nsum(lambda k: (-1)**(k+1) / k**2, [1, inf]).ae(pi**2 / 12)
@@ -18,6 +21,34 @@ def test_nsum():
     assert abs(fp.nsum(lambda k: 1/k**4, [1, fp.inf]) - 1.082323233711138) < 1e-5
     assert abs(fp.nsum(lambda k: 1/k**4, [1, fp.inf], method='e') - 1.082323233711138) < 1e-4
 
+def test_richardson():
+    S = [4*fsum(mpf(-1)**n/(2*n+1) for n in range(m)) for m in range(1,30)]
+    v, c = richardson(S)
+    assert abs(v - pi) < 1e-8
+    v, c = richardson([x*(1+j) for x in S])
+    assert abs(v - pi*(1+j)) < 1e-8
+    v, c = fp.richardson([float(x) for x in S])
+    assert abs(v - fp.pi) < 1e-8
+    S = [fsum(mpf(1)/k**2 for k in range(1,m)) for m in range(2,14)]
+    v, c = richardson(S)
+    assert abs(v - pi**2/6) < 1e-4
+
+def test_shanks():
+    S = [4*fsum(mpf(-1)**n/(2*n+1) for n in range(m)) for m in range(1,30)]
+    T = shanks(S)
+    assert abs(T[-1][-1] - pi) < 1e-12
+    T = shanks(S[:25], shanks(S[:7]))
+    assert abs(T[-1][-1] - pi) < 1e-12
+    T = shanks([x*(1+j) for x in S])
+    assert abs(T[-1][-1] - pi*(1+j)) < 1e-12
+    T = fp.shanks([float(x) for x in S])
+    assert abs(T[-1][-1] - fp.pi) < 1e-10
+    assert shanks([mpf(1)-mpf(2)**-k for k in range(1,8)])[-1][-1] == 1
+    T = shanks(S, tol=1e-6)
+    assert len(T) < 28 and len(T) % 2 == 0
+    assert abs(T[-1][-1] - T[-1][-3]) <= 1e-6
+    assert shanks(S, T)[-1][-1] == shanks(S)[-1][-1]
+
 def test_nprod():
     assert nprod(lambda k: exp(1/k**2), [1,inf], method='r').ae(exp(pi**2/6))
     assert nprod(lambda x: x**2, [1, 3]) == 36
@@ -43,8 +74,17 @@ def test_fsum():
     assert fsum([inf,-inf], absolute=1) == inf
     assert fsum([inf,-inf], squared=1) == inf
     assert fsum([inf,-inf], absolute=1, squared=1) == inf
+    assert fsum(range(1, 101)) == 5050
+    assert fsum([10**30, 0.25, 1, -10**30]) == 1.25
+    assert fsum([-3, 4], absolute=1, squared=1) == 25
     assert iv.fsum([1,mpi(2,3)]) == mpi(3,4)
 
 def test_fprod():
     assert fprod([]) == 1
     assert fprod([2,3]) == 6
+    assert fprod([2,1+1j,3]) == 6+6j
+    assert fprod([1j,1j]) == -1
+    assert fprod(iter([0.5,pi])) == pi/2
+    assert fprod(range(1,100)) == fac(99)
+    assert fprod([3j, 10**40, 2]) == 6j*10**40
+    assert fprod([3, matrix([[1, 2], [3, 4]]), 2]) == matrix([[6, 12], [18, 24]])